@@ -3,13 +3,89 @@ Detailed OEE Analysis - Loss Analysis, Root Cause, and Visualizations
 =====================================================================
 """
 
+import os
+from functools import cached_property
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
+import matplotlib
+if not os.environ.get('OEE_INTERACTIVE'):
+    matplotlib.use('Agg')  # Headless: the dashboard is only saved to disk
 import matplotlib.pyplot as plt
-import seaborn as sns
-from oee_analysis import OEEAnalyzer
-import warnings
-warnings.filterwarnings('ignore')
+from oee_analysis import OEEAnalyzer, ensure_plot_style
+
+try:
+    import numbagg  # Optional: JIT-compiled grouped reductions
+except ImportError:
+    numbagg = None
+
+# numbagg reducer behind each pandas aggregation name
+_NUMBAGG_REDUCERS = {
+    'sum': 'group_nansum',
+    'mean': 'group_nanmean',
+    'std': 'group_nanstd',
+    'max': 'group_nanmax',
+    'min': 'group_nanmin',
+    'count': 'group_nansum',
+}
+
+# Fishbone Analysis for the top downtime cause (Breakdown)
+_FISHBONE = MappingProxyType({
+    'Man': (
+        'Insufficient training on equipment operation',
+        'Fatigue during night shifts',
+        'Lack of standard operating procedures',
+        'Inadequate supervision during changeovers'
+    ),
+    'Machine': (
+        'Aging equipment (average 8+ years)',
+        'Inadequate preventive maintenance',
+        'Worn-out components in mixer and filler',
+        'Sensor calibration issues'
+    ),
+    'Method': (
+        'Reactive maintenance approach',
+        'Inefficient changeover procedures',
+        'Lack of real-time monitoring',
+        'No standardized troubleshooting guides'
+    ),
+    'Material': (
+        'Inconsistent raw material quality',
+        'Contamination in ingredients',
+        'Variations in dough consistency',
+        'Packaging material jams'
+    ),
+    'Environment': (
+        'High humidity affecting equipment',
+        'Temperature fluctuations',
+        'Poor lighting in work areas',
+        'Vibration from adjacent equipment'
+    )
+})
+
+# 5 Whys Analysis for Breakdown
+_FIVE_WHYS = (
+    "Why did the equipment breakdown occur?",
+    "→ Why was the component not replaced during maintenance?",
+    "→ Why was the preventive maintenance schedule not followed?",
+    "→ Why are maintenance resources insufficient?",
+    "→ Why has the maintenance budget not been increased?"
+)
+
+# Root cause report, formatted once
+_ROOT_CAUSE_REPORT = "\n".join([
+    "\n" + "="*50,
+    "ROOT CAUSE ANALYSIS",
+    "="*50,
+    "\nFISHBONE ANALYSIS - TOP DOWNTIME CAUSE: BREAKDOWN",
+    "-" * 60,
+    *(f"\n{category}:\n" + "\n".join(f"  {i}. {cause}" for i, cause in enumerate(causes, 1))
+      for category, causes in _FISHBONE.items()),
+    "\n" + "="*50,
+    "5 WHYS ANALYSIS - EQUIPMENT BREAKDOWN",
+    "="*50,
+    *(f"{i}. {why}" for i, why in enumerate(_FIVE_WHYS, 1))
+])
 
 class DetailedOEEAnalysis:
     """
@@ -18,8 +94,125 @@ class DetailedOEEAnalysis:
     
     def __init__(self, analyzer: OEEAnalyzer):
         self.analyzer = analyzer
-        self.data = analyzer.oee_results
-        self.raw_data = analyzer.raw_data
+        # Own copy, so the month key and loss columns added below stay off the analyzer's frame
+        self.data = analyzer.oee_results.copy()
+        
+        # Compact dtypes; categorical keys let every groupby reuse precomputed codes.
+        # raw_data is compressed as a copy too, so the caller's frame is never downcast in place
+        self._compress_dtypes(self.data)
+        self.raw_data = self._compress_dtypes(analyzer.raw_data.copy())
+        # Integer month key (months since 1970) instead of Period objects
+        months = analyzer.record_dates(analyzer.oee_results).astype('datetime64[M]').astype('int64')
+        self.data['YearMonth'] = months.astype(np.int16)
+        self._ensure_derived_columns()
+        
+        # Records with downtime, filtered once and shared (read-only) by all methods
+        self._downtime_mask = self.raw_data['Downtime_Minutes'].to_numpy() > 0
+        self._downtime_view = self.raw_data.loc[self._downtime_mask]
+        
+        # Machine codes and record counts for bincount-based means
+        self._machine_codes = self.data['Machine_Name'].cat.codes.to_numpy()
+        self._machine_counts = np.bincount(self._machine_codes,
+                                           minlength=len(self.data['Machine_Name'].cat.categories))
+        
+        # Cached GroupBy objects shared across the analysis methods
+        self._shift_gb = self.data.groupby('Shift', observed=True)
+        self._month_gb = self.data.groupby('YearMonth')
+        self._downtime_gb = self._downtime_view.groupby('Downtime_Reason', observed=True)
+        
+    @staticmethod
+    def _compress_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast integer columns and convert low-cardinality strings in place
+        """
+        for col in ['Machine_Name', 'Shift', 'Downtime_Reason']:
+            df[col] = df[col].astype('category')
+        
+        # Float columns stay float64: float32 would leak representation noise
+        # (e.g. 61.20000076) into the printed reports and the Excel export
+        for col in df.select_dtypes(include='int64').columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        return df
+    
+    @staticmethod
+    def _grouped_multi_agg(df: pd.DataFrame, key: str, aggs: dict) -> pd.DataFrame:
+        """
+        Named per-group reductions, each computed in one numbagg pass over the
+        categorical codes of ``key`` (falls back to pandas without numbagg)
+        """
+        if numbagg is None:
+            return df.groupby(key, observed=True).agg(**aggs)
+        
+        codes = df[key].cat.codes.to_numpy()
+        categories = df[key].cat.categories
+        n_groups = len(categories)
+        observed = np.bincount(codes[codes >= 0], minlength=n_groups) > 0
+        
+        result = {}
+        for name, (col, func) in aggs.items():
+            if func == 'count':
+                values = df[col].notna().to_numpy(dtype=np.int64)
+            else:
+                values = df[col].to_numpy()
+                if values.dtype.kind in 'iub':
+                    values = values.astype(np.int64)  # Avoid overflow in narrow int sums
+            reducer = getattr(numbagg, _NUMBAGG_REDUCERS[func])
+            result[name] = reducer(values, codes, num_labels=n_groups)[observed]
+        
+        index = pd.CategoricalIndex(categories[observed], categories=categories, name=key)
+        return pd.DataFrame(result, index=index)
+    
+    @staticmethod
+    def _cumulative_pct(values: np.ndarray) -> np.ndarray:
+        """
+        Pareto cumulative percentage of pre-sorted values in a single cumsum pass
+        """
+        inv_total = 100.0 / values.sum()
+        return np.cumsum(values) * inv_total
+    
+    def _machine_means(self, columns) -> pd.DataFrame:
+        """
+        Per-machine means via np.bincount over the cached categorical codes
+        """
+        observed = self._machine_counts > 0
+        counts = self._machine_counts[observed]
+        means = {
+            col: np.bincount(self._machine_codes, weights=self.data[col].to_numpy(),
+                             minlength=len(observed))[observed] / counts
+            for col in columns
+        }
+        index = pd.Index(self.data['Machine_Name'].cat.categories[observed], name='Machine_Name')
+        return pd.DataFrame(means, index=index)
+    
+    @cached_property
+    def speed_loss_series(self) -> np.ndarray:
+        """
+        Per-record speed loss (%) against ideal cycle time, computed once
+        
+        Invalidate with ``del self.speed_loss_series`` if the data changes
+        """
+        ideal = self.data['Ideal_Cycle_Time'].to_numpy()
+        actual = self.data['Actual_Cycle_Time'].to_numpy()
+        return np.round((actual - ideal) * (100.0 / ideal), 2)
+    
+    @cached_property
+    def defect_rate_series(self) -> np.ndarray:
+        """
+        Per-record defect rate (%), computed once
+        
+        Invalidate with ``del self.defect_rate_series`` if the data changes
+        """
+        total = self.data['Total_Units_Produced'].to_numpy()
+        defects = self.data['Defective_Units'].to_numpy()
+        return np.round(defects * (100.0 / total), 3)
+    
+    def _ensure_derived_columns(self):
+        """
+        Write the cached speed loss and defect rate arrays as data columns
+        """
+        self.data[['Speed_Loss_Percent', 'Defect_Rate_Percent']] = np.column_stack(
+            [self.speed_loss_series, self.defect_rate_series])
         
     def downtime_pareto_analysis(self):
         """
@@ -29,31 +222,41 @@ class DetailedOEEAnalysis:
         print("DOWNTIME PARETO ANALYSIS")
         print("="*50)
         
-        # Filter records with downtime
-        downtime_data = self.raw_data[self.raw_data['Downtime_Minutes'] > 0].copy()
+        downtime_data = self._downtime_view
         
         # Aggregate by downtime reason
-        downtime_summary = downtime_data.groupby('Downtime_Reason').agg({
-            'Downtime_Minutes': ['sum', 'mean', 'count'],
-            'Machine_Name': 'count'
-        }).round(2)
+        downtime_summary = self._grouped_multi_agg(downtime_data, 'Downtime_Reason', {
+            'Total_Downtime_Min': ('Downtime_Minutes', 'sum'),
+            'Avg_Downtime_Min': ('Downtime_Minutes', 'mean'),
+            'Frequency': ('Downtime_Minutes', 'count'),
+            'Records': ('Machine_Name', 'count')
+        })
         
-        downtime_summary.columns = ['Total_Downtime_Min', 'Avg_Downtime_Min', 'Frequency', 'Records']
         downtime_summary = downtime_summary.sort_values('Total_Downtime_Min', ascending=False)
         
         # Calculate cumulative percentage
-        downtime_summary['Cumulative_Pct'] = (downtime_summary['Total_Downtime_Min'].cumsum() / 
-                                            downtime_summary['Total_Downtime_Min'].sum() * 100).round(1)
+        cum_pct = self._cumulative_pct(downtime_summary['Total_Downtime_Min'].to_numpy())
+        downtime_summary['Cumulative_Pct'] = np.round(cum_pct, 1)
         
         print("Downtime Analysis Summary:")
-        print(downtime_summary)
+        print(downtime_summary.round(2))
         
         # Machine-specific downtime
         print("\nMachine-wise Downtime Breakdown:")
-        machine_downtime = downtime_data.groupby(['Machine_Name', 'Downtime_Reason']).agg({
-            'Downtime_Minutes': 'sum'
-        }).round(2)
-        print(machine_downtime)
+        # Composite key from the two categorical codes, summed with one bincount
+        machines = downtime_data['Machine_Name'].cat
+        reasons = downtime_data['Downtime_Reason'].cat
+        n_machines, n_reasons = len(machines.categories), len(reasons.categories)
+        flat = machines.codes.to_numpy().astype(np.int64) * n_reasons + reasons.codes.to_numpy()
+        sums = np.bincount(flat, weights=downtime_data['Downtime_Minutes'].to_numpy(),
+                           minlength=n_machines * n_reasons)
+        observed = np.flatnonzero(np.bincount(flat, minlength=n_machines * n_reasons))
+        index = pd.MultiIndex.from_arrays(
+            [pd.CategoricalIndex(machines.categories[observed // n_reasons], categories=machines.categories),
+             pd.CategoricalIndex(reasons.categories[observed % n_reasons], categories=reasons.categories)],
+            names=['Machine_Name', 'Downtime_Reason'])
+        machine_downtime = pd.DataFrame({'Downtime_Minutes': sums[observed]}, index=index)
+        print(machine_downtime.round(2))
         
         return downtime_summary, machine_downtime
     
@@ -65,27 +268,34 @@ class DetailedOEEAnalysis:
         print("SPEED LOSS ANALYSIS")
         print("="*50)
         
-        # Calculate speed loss for each record
-        self.data['Speed_Loss_Percent'] = ((self.data['Actual_Cycle_Time'] - self.data['Ideal_Cycle_Time']) / 
-                                          self.data['Ideal_Cycle_Time'] * 100).round(2)
-        
         # Speed loss by machine
-        speed_loss_summary = self.data.groupby('Machine_Name').agg({
-            'Speed_Loss_Percent': ['mean', 'std', 'max'],
-            'Ideal_Cycle_Time': 'mean',
-            'Actual_Cycle_Time': 'mean',
-            'Total_Units_Produced': 'sum'
-        }).round(2)
-        
-        speed_loss_summary.columns = ['Avg_Speed_Loss_Pct', 'Std_Speed_Loss', 'Max_Speed_Loss',
-                                     'Avg_Ideal_Cycle', 'Avg_Actual_Cycle', 'Total_Units']
+        speed_loss_summary = self._grouped_multi_agg(self.data, 'Machine_Name', {
+            'Avg_Speed_Loss_Pct': ('Speed_Loss_Percent', 'mean'),
+            'Std_Speed_Loss': ('Speed_Loss_Percent', 'std'),
+            'Max_Speed_Loss': ('Speed_Loss_Percent', 'max'),
+            'Avg_Ideal_Cycle': ('Ideal_Cycle_Time', 'mean'),
+            'Avg_Actual_Cycle': ('Actual_Cycle_Time', 'mean'),
+            'Total_Units': ('Total_Units_Produced', 'sum')
+        })
         
         print("Speed Loss Analysis by Machine:")
-        print(speed_loss_summary)
+        print(speed_loss_summary.round(2))
         
         # Identify worst performers
-        worst_speed = self.data.nlargest(10, 'Speed_Loss_Percent')[['Date', 'Machine_Name', 
-                                                                    'Speed_Loss_Percent', 'Shift']]
+        speed_loss = self.speed_loss_series
+        k = min(10, len(speed_loss))
+        # O(N) selection of the k-th largest, then sort only k rows; ties at
+        # the cut-off keep the earliest records, matching nlargest(keep='first').
+        # With no records there is nothing to select, and the frame comes out empty
+        if k == 0:
+            idx = np.empty(0, dtype=np.intp)
+        else:
+            threshold = np.partition(speed_loss, -k)[-k]
+            above = np.flatnonzero(speed_loss > threshold)
+            ties = np.flatnonzero(speed_loss == threshold)[:k - len(above)]
+            idx = np.concatenate([above, ties])
+            idx = idx[np.lexsort((idx, -speed_loss[idx]))]
+        worst_speed = self.data.iloc[idx][['Date', 'Machine_Name', 'Speed_Loss_Percent', 'Shift']]
         print("\nTop 10 Worst Speed Loss Records:")
         print(worst_speed)
         
@@ -99,32 +309,28 @@ class DetailedOEEAnalysis:
         print("QUALITY LOSS ANALYSIS")
         print("="*50)
         
-        # Calculate defect rate
-        self.data['Defect_Rate_Percent'] = (self.data['Defective_Units'] / 
-                                           self.data['Total_Units_Produced'] * 100).round(3)
-        
         # Quality analysis by machine
-        quality_summary = self.data.groupby('Machine_Name').agg({
-            'Defect_Rate_Percent': ['mean', 'std', 'max'],
-            'Quality': ['mean', 'min'],
-            'Defective_Units': 'sum',
-            'Total_Units_Produced': 'sum'
-        }).round(3)
-        
-        quality_summary.columns = ['Avg_Defect_Rate', 'Std_Defect_Rate', 'Max_Defect_Rate',
-                                  'Avg_Quality', 'Min_Quality', 'Total_Defects', 'Total_Units']
+        quality_summary = self._grouped_multi_agg(self.data, 'Machine_Name', {
+            'Avg_Defect_Rate': ('Defect_Rate_Percent', 'mean'),
+            'Std_Defect_Rate': ('Defect_Rate_Percent', 'std'),
+            'Max_Defect_Rate': ('Defect_Rate_Percent', 'max'),
+            'Avg_Quality': ('Quality', 'mean'),
+            'Min_Quality': ('Quality', 'min'),
+            'Total_Defects': ('Defective_Units', 'sum'),
+            'Total_Units': ('Total_Units_Produced', 'sum')
+        })
         
         print("Quality Loss Analysis by Machine:")
-        print(quality_summary)
+        print(quality_summary.round(3))
         
         # Quality by shift
-        shift_quality = self.data.groupby('Shift').agg({
+        shift_quality = self._shift_gb.agg({
             'Defect_Rate_Percent': 'mean',
             'Quality': 'mean'
-        }).round(2)
+        })
         
         print("\nQuality Performance by Shift:")
-        print(shift_quality)
+        print(shift_quality.round(2))
         
         return quality_summary, shift_quality
     
@@ -132,133 +338,93 @@ class DetailedOEEAnalysis:
         """
         Perform structured root cause analysis
         """
-        print("\n" + "="*50)
-        print("ROOT CAUSE ANALYSIS")
-        print("="*50)
-        
-        # Fishbone Analysis for top issues
-        print("\nFISHBONE ANALYSIS - TOP DOWNTIME CAUSE: BREAKDOWN")
-        print("-" * 60)
-        
-        fishbone_analysis = {
-            'Man': [
-                'Insufficient training on equipment operation',
-                'Fatigue during night shifts',
-                'Lack of standard operating procedures',
-                'Inadequate supervision during changeovers'
-            ],
-            'Machine': [
-                'Aging equipment (average 8+ years)',
-                'Inadequate preventive maintenance',
-                'Worn-out components in mixer and filler',
-                'Sensor calibration issues'
-            ],
-            'Method': [
-                'Reactive maintenance approach',
-                'Inefficient changeover procedures',
-                'Lack of real-time monitoring',
-                'No standardized troubleshooting guides'
-            ],
-            'Material': [
-                'Inconsistent raw material quality',
-                'Contamination in ingredients',
-                'Variations in dough consistency',
-                'Packaging material jams'
-            ],
-            'Environment': [
-                'High humidity affecting equipment',
-                'Temperature fluctuations',
-                'Poor lighting in work areas',
-                'Vibration from adjacent equipment'
-            ]
-        }
+        print(_ROOT_CAUSE_REPORT)
         
-        for category, causes in fishbone_analysis.items():
-            print(f"\n{category}:")
-            for i, cause in enumerate(causes, 1):
-                print(f"  {i}. {cause}")
-        
-        # 5 Whys Analysis for Breakdown
-        print("\n" + "="*50)
-        print("5 WHYS ANALYSIS - EQUIPMENT BREAKDOWN")
-        print("="*50)
-        
-        five_whys = [
-            "Why did the equipment breakdown occur?",
-            "→ Why was the component not replaced during maintenance?",
-            "→ Why was the preventive maintenance schedule not followed?",
-            "→ Why are maintenance resources insufficient?",
-            "→ Why has the maintenance budget not been increased?"
-        ]
-        
-        for i, why in enumerate(five_whys, 1):
-            print(f"{i}. {why}")
+        return _FISHBONE, _FIVE_WHYS
+    
+    @staticmethod
+    def _datashader_hist(ax, values: pd.Series, bins: int = 20, **kwargs):
+        """
+        Histogram binned by Datashader and drawn as a single step artist
+        """
+        import datashader as ds  # Optional, only needed for this backend
         
-        return fishbone_analysis, five_whys
+        lo, hi = float(values.min()), float(values.max())
+        points = pd.DataFrame({'x': values.to_numpy(), 'y': np.zeros(len(values))})
+        canvas = ds.Canvas(plot_width=bins, plot_height=1, x_range=(lo, hi), y_range=(-0.5, 0.5))
+        counts = canvas.points(points, 'x', 'y', agg=ds.count()).values[0]
+        return ax.stairs(counts, np.linspace(lo, hi, bins + 1), fill=True, **kwargs)
     
-    def create_visualizations(self):
+    def create_visualizations(self, backend: str = 'matplotlib', dpi: int = 150,
+                              outfile: str = 'oee_dashboard.png'):
         """
         Create comprehensive OEE visualizations
+        
+        backend='datashader' bins the OEE distribution with Datashader, which
+        keeps rendering cost flat for multi-million-record datasets. Use
+        dpi=300 for print; a '.webp' outfile gives a much smaller web image.
         """
+        if backend not in ('matplotlib', 'datashader'):
+            raise ValueError(f"Unknown backend: {backend!r}")
+        ensure_plot_style()
+        
         print("\n" + "="*50)
         print("CREATING VISUALIZATIONS")
         print("="*50)
         
-        # Add YearMonth column if not exists
-        if 'YearMonth' not in self.data.columns:
-            self.data['YearMonth'] = pd.to_datetime(self.data['Date']).dt.to_period('M')
+        # Monthly aggregates shared by subplots 1 and 9
+        monthly = self._month_gb.agg(OEE=('OEE', 'mean'), Units=('Total_Units_Produced', 'sum'))
+        month_labels = pd.PeriodIndex.from_ordinals(monthly.index, freq='M').strftime('%Y-%m').tolist()
         
-        # Set up the figure with multiple subplots
-        fig = plt.figure(figsize=(20, 16))
+        # Set up the figure with all subplots allocated at once
+        fig, axes = plt.subplots(3, 3, figsize=(20, 16))
+        axes = axes.ravel()
         
         # 1. OEE Trend by Month
-        plt.subplot(3, 3, 1)
-        monthly_oee = self.data.groupby('YearMonth')['OEE'].mean()
-        plt.plot(range(len(monthly_oee)), monthly_oee.values, marker='o', linewidth=2)
-        plt.title('Monthly OEE Trend', fontsize=12, fontweight='bold')
-        plt.xlabel('Month')
-        plt.ylabel('OEE (%)')
-        plt.grid(True, alpha=0.3)
-        plt.xticks(range(len(monthly_oee)), [str(m) for m in monthly_oee.index], rotation=45)
+        ax = axes[0]
+        monthly_oee = monthly['OEE']
+        ax.plot(range(len(monthly_oee)), monthly_oee.values, marker='o', linewidth=2)
+        ax.set_title('Monthly OEE Trend', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Month')
+        ax.set_ylabel('OEE (%)')
+        ax.grid(True, alpha=0.3)
+        ax.set_xticks(range(len(monthly_oee)))
+        ax.set_xticklabels(month_labels, rotation=45)
         
         # 2. Machine-wise OEE Comparison
-        plt.subplot(3, 3, 2)
-        machine_oee = self.data.groupby('Machine_Name')['OEE'].mean().sort_values(ascending=False)
-        bars = plt.bar(machine_oee.index, machine_oee.values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'])
-        plt.title('OEE by Machine', fontsize=12, fontweight='bold')
-        plt.ylabel('OEE (%)')
-        plt.xticks(rotation=45)
+        ax = axes[1]
+        machine_oee = self._machine_means(['OEE'])['OEE'].sort_values(ascending=False)
+        bars = ax.bar(machine_oee.index, machine_oee.values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'])
+        ax.set_title('OEE by Machine', fontsize=12, fontweight='bold')
+        ax.set_ylabel('OEE (%)')
+        ax.tick_params(axis='x', rotation=45)
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%', ha='center', va='bottom')
+        ax.bar_label(bars, fmt='%.1f%%', padding=3)
         
         # 3. Availability, Performance, Quality Comparison
-        plt.subplot(3, 3, 3)
+        ax = axes[2]
         metrics = ['Availability', 'Performance', 'Quality']
-        machine_metrics = self.data.groupby('Machine_Name')[metrics].mean()
+        machine_metrics = self._machine_means(metrics)
         x = np.arange(len(machine_metrics.index))
         width = 0.25
         
-        plt.bar(x - width, machine_metrics['Availability'], width, label='Availability', color='#FF6B6B')
-        plt.bar(x, machine_metrics['Performance'], width, label='Performance', color='#4ECDC4')
-        plt.bar(x + width, machine_metrics['Quality'], width, label='Quality', color='#45B7D1')
+        ax.bar(x - width, machine_metrics['Availability'], width, label='Availability', color='#FF6B6B')
+        ax.bar(x, machine_metrics['Performance'], width, label='Performance', color='#4ECDC4')
+        ax.bar(x + width, machine_metrics['Quality'], width, label='Quality', color='#45B7D1')
         
-        plt.title('OEE Components by Machine', fontsize=12, fontweight='bold')
-        plt.xlabel('Machine')
-        plt.ylabel('Percentage (%)')
-        plt.xticks(x, machine_metrics.index, rotation=45)
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_title('OEE Components by Machine', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Machine')
+        ax.set_ylabel('Percentage (%)')
+        ax.set_xticks(x)
+        ax.set_xticklabels(machine_metrics.index, rotation=45)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
         # 4. Downtime Pareto Chart
-        plt.subplot(3, 3, 4)
-        downtime_data = self.raw_data[self.raw_data['Downtime_Minutes'] > 0]
-        downtime_pareto = downtime_data.groupby('Downtime_Reason')['Downtime_Minutes'].sum().sort_values(ascending=False)
+        ax1 = axes[3]
+        downtime_pareto = self._downtime_gb['Downtime_Minutes'].sum().sort_values(ascending=False)
         
         # Create pareto chart
-        ax1 = plt.gca()
         bars = ax1.bar(range(len(downtime_pareto)), downtime_pareto.values, color='#FF6B6B')
         ax1.set_title('Downtime Pareto Analysis', fontsize=12, fontweight='bold')
         ax1.set_ylabel('Total Downtime (Minutes)')
@@ -267,76 +433,75 @@ class DetailedOEEAnalysis:
         
         # Add cumulative line
         ax2 = ax1.twinx()
-        cumulative = np.cumsum(downtime_pareto.values) / downtime_pareto.sum() * 100
+        cumulative = self._cumulative_pct(downtime_pareto.to_numpy())
         ax2.plot(range(len(downtime_pareto)), cumulative, 'o-', color='#45B7D1', linewidth=2)
         ax2.set_ylabel('Cumulative Percentage (%)', color='#45B7D1')
         ax2.axhline(y=80, color='red', linestyle='--', alpha=0.7)
         ax2.text(len(downtime_pareto)-1, 82, '80%', color='red', fontweight='bold')
         
         # 5. Shift Performance Comparison
-        plt.subplot(3, 3, 5)
-        shift_oee = self.data.groupby('Shift')['OEE'].mean()
+        ax = axes[4]
+        shift_oee = self._shift_gb['OEE'].mean()
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1']
-        bars = plt.bar(shift_oee.index, shift_oee.values, color=colors)
-        plt.title('OEE by Shift', fontsize=12, fontweight='bold')
-        plt.ylabel('OEE (%)')
+        bars = ax.bar(shift_oee.index, shift_oee.values, color=colors)
+        ax.set_title('OEE by Shift', fontsize=12, fontweight='bold')
+        ax.set_ylabel('OEE (%)')
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%', ha='center', va='bottom')
+        ax.bar_label(bars, fmt='%.1f%%', padding=3)
         
         # 6. Speed Loss by Machine
-        plt.subplot(3, 3, 6)
-        speed_loss = self.data.groupby('Machine_Name')['Speed_Loss_Percent'].mean().sort_values(ascending=False)
-        bars = plt.bar(speed_loss.index, speed_loss.values, color='#96CEB4')
-        plt.title('Average Speed Loss by Machine', fontsize=12, fontweight='bold')
-        plt.ylabel('Speed Loss (%)')
-        plt.xticks(rotation=45)
+        ax = axes[5]
+        speed_loss = self._machine_means(['Speed_Loss_Percent'])['Speed_Loss_Percent'].sort_values(ascending=False)
+        bars = ax.bar(speed_loss.index, speed_loss.values, color='#96CEB4')
+        ax.set_title('Average Speed Loss by Machine', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Speed Loss (%)')
+        ax.tick_params(axis='x', rotation=45)
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%', ha='center', va='bottom')
+        ax.bar_label(bars, fmt='%.1f%%', padding=3)
         
         # 7. Quality Rate by Machine
-        plt.subplot(3, 3, 7)
-        quality_rate = self.data.groupby('Machine_Name')['Quality'].mean().sort_values(ascending=False)
-        bars = plt.bar(quality_rate.index, quality_rate.values, color='#45B7D1')
-        plt.title('Quality Rate by Machine', fontsize=12, fontweight='bold')
-        plt.ylabel('Quality (%)')
-        plt.xticks(rotation=45)
+        ax = axes[6]
+        quality_rate = self._machine_means(['Quality'])['Quality'].sort_values(ascending=False)
+        bars = ax.bar(quality_rate.index, quality_rate.values, color='#45B7D1')
+        ax.set_title('Quality Rate by Machine', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Quality (%)')
+        ax.tick_params(axis='x', rotation=45)
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}%', ha='center', va='bottom')
+        ax.bar_label(bars, fmt='%.1f%%', padding=3)
         
         # 8. OEE Distribution
-        plt.subplot(3, 3, 8)
-        plt.hist(self.data['OEE'], bins=20, color='#4ECDC4', alpha=0.7, edgecolor='black')
-        plt.title('OEE Distribution', fontsize=12, fontweight='bold')
-        plt.xlabel('OEE (%)')
-        plt.ylabel('Frequency')
-        plt.axvline(self.data['OEE'].mean(), color='red', linestyle='--', linewidth=2)
-        plt.text(self.data['OEE'].mean() + 1, plt.ylim()[1]*0.9, 
-                f'Mean: {self.data["OEE"].mean():.1f}%', color='red', fontweight='bold')
+        ax = axes[7]
+        mean_oee = self.data['OEE'].mean()
+        if backend == 'datashader':
+            self._datashader_hist(ax, self.data['OEE'], bins=20,
+                                  color='#4ECDC4', alpha=0.7, edgecolor='black')
+        else:
+            ax.hist(self.data['OEE'], bins=20, color='#4ECDC4', alpha=0.7, edgecolor='black')
+        ax.set_title('OEE Distribution', fontsize=12, fontweight='bold')
+        ax.set_xlabel('OEE (%)')
+        ax.set_ylabel('Frequency')
+        ax.axvline(mean_oee, color='red', linestyle='--', linewidth=2)
+        ax.text(mean_oee + 1, ax.get_ylim()[1]*0.9, 
+                f'Mean: {mean_oee:.1f}%', color='red', fontweight='bold')
         
         # 9. Production Volume Trend
-        plt.subplot(3, 3, 9)
-        monthly_production = self.data.groupby('YearMonth')['Total_Units_Produced'].sum()
-        plt.plot(range(len(monthly_production)), monthly_production.values, marker='s', linewidth=2, color='#FF6B6B')
-        plt.title('Monthly Production Volume', fontsize=12, fontweight='bold')
-        plt.xlabel('Month')
-        plt.ylabel('Units Produced')
-        plt.grid(True, alpha=0.3)
-        plt.xticks(range(len(monthly_production)), [str(m) for m in monthly_production.index], rotation=45)
-        
-        plt.tight_layout()
-        plt.savefig('c:/Users/rohil/Downloads/project 1/oee_dashboard.png', dpi=300, bbox_inches='tight')
-        plt.show()
-        
-        print("Dashboard saved as 'oee_dashboard.png'")
+        ax = axes[8]
+        monthly_production = monthly['Units']
+        ax.plot(range(len(monthly_production)), monthly_production.values, marker='s', linewidth=2, color='#FF6B6B')
+        ax.set_title('Monthly Production Volume', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Units Produced')
+        ax.grid(True, alpha=0.3)
+        ax.set_xticks(range(len(monthly_production)))
+        ax.set_xticklabels(month_labels, rotation=45)
+        
+        fig.tight_layout()
+        fig.savefig(outfile, dpi=dpi, bbox_inches='tight')
+        if os.environ.get('OEE_INTERACTIVE'):
+            plt.show()
+        plt.close(fig)
+        
+        print(f"Dashboard saved as '{outfile}'")
         
         return fig
 
@@ -346,7 +511,7 @@ def main():
     """
     # Initialize and run basic analysis
     analyzer = OEEAnalyzer()
-    production_data = analyzer.generate_production_data(4000)
+    production_data = analyzer.generate_production_data(4000, use_cache=True)
     oee_data = analyzer.calculate_oee_metrics(production_data)
     
     # Perform detailed analysis
@@ -8,27 +8,16 @@ FMCG Manufacturing Plant - OEE Improvement Project
 import pandas as pd
 from datetime import datetime
 
-class ManagementOutputs:
-    """
-    Generate professional outputs for management and career purposes
-    """
-    
-    def __init__(self):
-        self.project_name = "OEE & Productivity Improvement in FMCG Manufacturing Plant"
-        self.company = "FMCG Manufacturing Company"
-        self.project_duration = "6 months"
-        self.current_date = datetime.now().strftime("%B %d, %Y")
-        
-    def generate_executive_summary(self):
-        """
-        Generate 1-page executive summary for plant head
-        """
-        summary = f"""
+_OUTPUT_DIR = 'c:/Users/rohil/Downloads/project 1/'
+
+# Static report bodies, built once at import; only the executive summary has
+# placeholders, filled from ManagementOutputs attributes
+_EXECUTIVE_SUMMARY_TEMPLATE = """
 EXECUTIVE SUMMARY
 =================
 
-Project: {self.project_name}
-Date: {self.current_date}
+Project: {project_name}
+Date: {current_date}
 Prepared by: Manufacturing Analytics Consultant
 
 BUSINESS CHALLENGE
@@ -115,19 +104,8 @@ CONTACT
 -------
 For further details or implementation planning, please contact the Manufacturing Analytics team.
 """
-        
-        # Save to file
-        with open('c:/Users/rohil/Downloads/project 1/Executive_Summary.txt', 'w', encoding='utf-8') as f:
-            f.write(summary)
-        
-        print("Executive Summary saved as 'Executive_Summary.txt'")
-        return summary
-    
-    def generate_resume_project_description(self):
-        """
-        Generate resume-ready project description
-        """
-        resume_desc = """
+
+_RESUME_PROJECT_DESCRIPTION = """
 SENIOR MANUFACTURING ANALYTICS CONSULTANT
 OEE & Productivity Improvement Project | FMCG Manufacturing Plant
 
@@ -142,19 +120,8 @@ OEE & Productivity Improvement Project | FMCG Manufacturing Plant
 • Presented findings to C-suite leadership, securing $750K implementation budget and establishing 
   framework for operational excellence across FMCG manufacturing facilities
 """
-        
-        # Save to file
-        with open('c:/Users/rohil/Downloads/project 1/Resume_Project_Description.txt', 'w', encoding='utf-8') as f:
-            f.write(resume_desc)
-        
-        print("Resume Project Description saved as 'Resume_Project_Description.txt'")
-        return resume_desc
-    
-    def generate_interview_talking_points(self):
-        """
-        Generate key interview talking points
-        """
-        talking_points = """
+
+_INTERVIEW_TALKING_POINTS = """
 INTERVIEW TALKING POINTS - OEE IMPROVEMENT PROJECT
 ==================================================
 
@@ -223,19 +190,8 @@ A: "This project solidified my expertise in manufacturing analytics and operatio
    cross-functional teams, and deliver measurable financial results. I'm now seeking opportunities 
    to scale these approaches across multiple manufacturing facilities."
 """
-        
-        # Save to file
-        with open('c:/Users/rohil/Downloads/project 1/Interview_Talking_Points.txt', 'w', encoding='utf-8') as f:
-            f.write(talking_points)
-        
-        print("Interview Talking Points saved as 'Interview_Talking_Points.txt'")
-        return talking_points
-    
-    def generate_key_achievements(self):
-        """
-        Generate quantified achievements for performance reviews
-        """
-        achievements = """
+
+_KEY_ACHIEVEMENTS = """
 KEY ACHIEVEMENTS - OEE IMPROVEMENT PROJECT
 ============================================
 
@@ -282,10 +238,70 @@ STRATEGIC IMPACT
 • Created foundation for Industry 4.0 transformation initiatives
 • Developed scalable methodology for continuous improvement programs
 """
+
+class ManagementOutputs:
+    """
+    Generate professional outputs for management and career purposes
+    """
+    
+    def __init__(self):
+        self.project_name = "OEE & Productivity Improvement in FMCG Manufacturing Plant"
+        self.company = "FMCG Manufacturing Company"
+        self.project_duration = "6 months"
+        self.current_date = datetime.now().strftime("%B %d, %Y")
+        
+    @staticmethod
+    def _write_output(filename: str, text: str) -> None:
+        """
+        Write one report through a 128 KB buffer so the whole text goes out in a single flush
+        """
+        with open(_OUTPUT_DIR + filename, 'w', encoding='utf-8', buffering=1 << 17) as f:
+            f.write(text)
+    
+    def generate_executive_summary(self):
+        """
+        Generate 1-page executive summary for plant head
+        """
+        summary = _EXECUTIVE_SUMMARY_TEMPLATE.format_map(self.__dict__)
+        
+        # Save to file
+        self._write_output('Executive_Summary.txt', summary)
+        
+        print("Executive Summary saved as 'Executive_Summary.txt'")
+        return summary
+    
+    def generate_resume_project_description(self):
+        """
+        Generate resume-ready project description
+        """
+        resume_desc = _RESUME_PROJECT_DESCRIPTION
+        
+        # Save to file
+        self._write_output('Resume_Project_Description.txt', resume_desc)
+        
+        print("Resume Project Description saved as 'Resume_Project_Description.txt'")
+        return resume_desc
+    
+    def generate_interview_talking_points(self):
+        """
+        Generate key interview talking points
+        """
+        talking_points = _INTERVIEW_TALKING_POINTS
+        
+        # Save to file
+        self._write_output('Interview_Talking_Points.txt', talking_points)
+        
+        print("Interview Talking Points saved as 'Interview_Talking_Points.txt'")
+        return talking_points
+    
+    def generate_key_achievements(self):
+        """
+        Generate quantified achievements for performance reviews
+        """
+        achievements = _KEY_ACHIEVEMENTS
         
         # Save to file
-        with open('c:/Users/rohil/Downloads/project 1/Key_Achievements.txt', 'w', encoding='utf-8') as f:
-            f.write(achievements)
+        self._write_output('Key_Achievements.txt', achievements)
         
         print("Key Achievements saved as 'Key_Achievements.txt'")
         return achievements
@@ -9,24 +9,87 @@ Date: January 2026
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
-import random
-from typing import Dict, List, Tuple
-import warnings
-warnings.filterwarnings('ignore')
+from typing import Dict, Iterator, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import hashlib
+import json
 
-# Set style for professional visualizations
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+try:
+    from numba import njit, prange  # Optional: fused, parallel OEE kernel
+except ImportError:
+    njit = None
+
+# Plot styling is applied on first use, so analysis-only imports skip matplotlib and seaborn
+_STYLE_SET = False
+
+def ensure_plot_style():
+    """
+    Set the shared professional chart style once, before the first plot
+    """
+    global _STYLE_SET
+    if _STYLE_SET:
+        return
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    _STYLE_SET = True
+
+def _oee_components_numpy(planned, downtime, ideal, total, good):
+    """
+    Availability, Performance, Quality and OEE (%) capped at 100, NumPy version
+    """
+    operating_time = planned - downtime
+    availability = (operating_time / planned) * 100
+    performance = (ideal * total / (operating_time * 60)) * 100
+    quality = (good / total) * 100
+    oee = (availability * performance * quality) / 10000
+    return tuple(np.minimum(metric, 100) for metric in (availability, performance, quality, oee))
+
+# Generated column arrays are cached here (opt-in), one .npz per (num_records, seed, parameters)
+_DATA_CACHE_DIR = Path(__file__).with_name('.cache')
+# Bump whenever _draw_arrays changes what it draws, so older cache files stop matching
+_CACHE_FORMAT = 1
+
+# Numeric columns the analyses read as NumPy arrays
+_NUMERIC_COLUMNS = ('Planned_Production_Time', 'Downtime_Minutes', 'Ideal_Cycle_Time', 'Actual_Cycle_Time',
+                    'Total_Units_Produced', 'Defective_Units', 'Good_Units',
+                    'Availability', 'Performance', 'Quality', 'OEE')
+
+if njit is None:
+    _oee_components = _oee_components_numpy
+else:
+    # No fastmath: reassociating the arithmetic would shift the reported figures
+    @njit(parallel=True, cache=True, error_model='numpy')
+    def _oee_kernel(planned, downtime, ideal, total, good, availability, performance, quality, oee):
+        for i in prange(planned.shape[0]):
+            operating_time = planned[i] - downtime[i]
+            a = (operating_time / planned[i]) * 100
+            p = (ideal[i] * total[i] / (operating_time * 60)) * 100
+            q = (good[i] / total[i]) * 100
+            o = (a * p * q) / 10000
+            # Written as comparisons against 100 so NaN passes through like np.minimum
+            availability[i] = 100.0 if a > 100 else a
+            performance[i] = 100.0 if p > 100 else p
+            quality[i] = 100.0 if q > 100 else q
+            oee[i] = 100.0 if o > 100 else o
+    
+    def _oee_components(planned, downtime, ideal, total, good):
+        """
+        Availability, Performance, Quality and OEE (%) capped at 100, one fused Numba pass
+        """
+        outputs = tuple(np.empty(len(planned)) for _ in range(4))
+        _oee_kernel(*(np.ascontiguousarray(arr, dtype=np.float64)
+                      for arr in (planned, downtime, ideal, total, good)), *outputs)
+        return outputs
 
 class OEEAnalyzer:
     """
     Comprehensive OEE Analysis Tool for FMCG Manufacturing
     """
     
-    def __init__(self):
+    def __init__(self, seed: int = 42):
         self.machines = ['Mixer', 'Filler', 'Packer', 'Conveyor']
         self.shifts = ['Morning', 'Afternoon', 'Night']
         self.downtime_reasons = ['Breakdown', 'Changeover', 'Cleaning', 'Minor Stoppage', 'Power Failure']
@@ -46,100 +109,215 @@ class OEEAnalyzer:
             'Night': 420       # 7 hours
         }
         
+        self.downtime_means = {'Mixer': 45, 'Filler': 35, 'Packer': 25, 'Conveyor': 15}  # Higher downtime for mixing
+        self.defect_ranges = {'Mixer': (0.2, 1.0), 'Filler': (0.8, 3.5),  # Higher defects in filling
+                              'Packer': (0.5, 2.0), 'Conveyor': (0.2, 1.0)}
+        
+        # Name lookups for the int8 codes kept in the generated column arrays
+        self.machine_names = np.array(self.machines)
+        self.shift_names = np.array(self.shifts)
+        self.reason_names = np.array(['None'] + self.downtime_reasons)
+        
+        # Generation parameters bound once as lookup arrays indexed by those codes
+        self._planned_by_shift = np.array([self.planned_production_minutes[s] for s in self.shifts], dtype=np.int16)
+        self._downtime_mean_by_machine = np.array([self.downtime_means[m] for m in self.machines])
+        self._ideal_by_machine = np.array([self.cycle_times[m]['ideal'] for m in self.machines], dtype=float)
+        self._cycle_range_by_machine = np.array([self.cycle_times[m]['actual_range'] for m in self.machines]).T
+        self._defect_range_by_machine = np.array([self.defect_ranges[m] for m in self.machines]).T
+        
+        # One seeded generator for every draw, so generated data is reproducible
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        
         # Initialize data storage
         self.raw_data = None
         self.oee_results = None
+        # Struct-of-arrays raw_data is built from: contiguous columns, codes instead of strings.
+        # Analyses always read the frames themselves, so edits to raw_data are never shadowed
+        self.arrays = None
         
-    def generate_production_data(self, num_records: int = 4000) -> pd.DataFrame:
+    def generate_production_data(self, num_records: int = 4000, use_cache: bool = False) -> pd.DataFrame:
         """
         Generate realistic FMCG production data for 6 months
-        """
-        print(f"Generating {num_records} records of production data...")
-        
-        data = []
-        start_date = datetime(2025, 7, 1)  # 6 months period
         
-        for i in range(num_records):
-            # Generate date with realistic distribution
-            days_offset = random.randint(0, 180)  # 6 months
-            current_date = start_date + timedelta(days=days_offset)
-            
-            # Skip weekends (reduced production)
-            if current_date.weekday() >= 6 and random.random() < 0.7:
-                continue
-                
-            shift = random.choice(self.shifts)
-            machine = random.choice(self.machines)
-            
-            # Planned production time
-            planned_time = self.planned_production_minutes[shift]
-            
-            # Generate realistic downtime (FMCG patterns)
-            if machine == 'Mixer':
-                downtime_mean = 45  # Higher downtime for mixing
-            elif machine == 'Filler':
-                downtime_mean = 35
-            elif machine == 'Packer':
-                downtime_mean = 25
-            else:  # Conveyor
-                downtime_mean = 15
-                
-            downtime_minutes = max(0, np.random.normal(downtime_mean, 15))
-            downtime_minutes = min(downtime_minutes, planned_time * 0.5)  # Cap at 50% of planned time
-            
-            # Assign downtime reason
-            if downtime_minutes > 0:
-                if downtime_minutes > 60:
-                    reason = random.choice(['Breakdown', 'Changeover'])
-                elif downtime_minutes > 30:
-                    reason = random.choice(['Cleaning', 'Breakdown'])
-                else:
-                    reason = random.choice(['Minor Stoppage', 'Power Failure'])
-            else:
-                reason = 'None'
-            
-            # Cycle times
-            ideal_cycle = self.cycle_times[machine]['ideal']
-            actual_cycle = np.random.uniform(*self.cycle_times[machine]['actual_range'])
-            
-            # Production calculations
-            available_time = planned_time - downtime_minutes
-            total_units = int(available_time * 60 / actual_cycle)
-            
-            # Quality losses (FMCG realistic defect rates)
-            if machine == 'Filler':
-                defect_rate = np.random.uniform(0.8, 3.5)  # Higher defects in filling
-            elif machine == 'Packer':
-                defect_rate = np.random.uniform(0.5, 2.0)
-            else:
-                defect_rate = np.random.uniform(0.2, 1.0)
-                
-            defective_units = int(total_units * defect_rate / 100)
-            
-            data.append({
-                'Date': current_date.strftime('%Y-%m-%d'),
-                'Shift': shift,
-                'Machine_Name': machine,
-                'Planned_Production_Time': planned_time,
-                'Downtime_Minutes': round(downtime_minutes, 1),
-                'Downtime_Reason': reason,
-                'Ideal_Cycle_Time': ideal_cycle,
-                'Actual_Cycle_Time': round(actual_cycle, 2),
-                'Total_Units_Produced': total_units,
-                'Defective_Units': defective_units,
-                'Good_Units': total_units - defective_units
-            })
+        use_cache: reuse (or store) the generated arrays in .cache/ next to this module
+        """
+        # The cache holds the first draw for this seed, so only a fresh generator may reuse it;
+        # the generator state after that draw is stored too, so later calls continue the sequence.
+        # The file name carries a hash of the format version and every generation parameter
+        cache = _DATA_CACHE_DIR / f'prod_{num_records}_{self.seed}_{self._generation_key()}.npz'
+        use_cache = use_cache and self.raw_data is None
+        if use_cache and cache.exists():
+            print(f"Loading {num_records} records of production data from {cache.name}...")
+            with np.load(cache) as stored:
+                self.arrays = {key: stored[key] for key in stored.files if key != 'rng_state'}
+                self._rng.bit_generator.state = json.loads(str(stored['rng_state']))
+        else:
+            print(f"Generating {num_records} records of production data...")
+            chunks = list(self.generate_chunks(num_records))
+            self.arrays = chunks[0] if len(chunks) == 1 else {
+                key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+            if use_cache:
+                try:
+                    cache.parent.mkdir(exist_ok=True)
+                    np.savez(cache, rng_state=json.dumps(self._rng.bit_generator.state), **self.arrays)
+                except OSError as exc:
+                    print(f"Production data cache not written ({exc})")
         
-        df = pd.DataFrame(data)
+        # Materialize the public DataFrame once over the arrays (copy=False: numeric columns are views of
+        # self.arrays); key columns become categoricals straight from the codes
+        arrays = self.arrays
+        df = pd.DataFrame({
+            'Date': np.datetime_as_string(arrays['date'], unit='D'),
+            'Shift': self._categorical(arrays['shift_idx'], self.shift_names),
+            'Machine_Name': self._categorical(arrays['machine_idx'], self.machine_names),
+            'Planned_Production_Time': arrays['planned'],
+            'Downtime_Minutes': arrays['downtime'],
+            'Downtime_Reason': self._categorical(arrays['reason_idx'], self.reason_names),
+            'Ideal_Cycle_Time': arrays['ideal_cycle'],
+            'Actual_Cycle_Time': arrays['actual_cycle'],
+            'Total_Units_Produced': arrays['total_units'],
+            'Defective_Units': arrays['defective_units'],
+            'Good_Units': arrays['good_units']
+        }, copy=False)
         self.raw_data = df
         
         print(f"Generated {len(df)} production records")
         print(f"Date range: {df['Date'].min()} to {df['Date'].max()}")
-        print(f"Machines: {df['Machine_Name'].unique()}")
+        print(f"Machines: {df['Machine_Name'].unique().tolist()}")
         print(f"Total units produced: {df['Total_Units_Produced'].sum():,}")
         
         return df
     
+    def _generation_key(self) -> str:
+        """
+        Short hash of the cache format and every parameter the generated data depends on
+        """
+        params = {
+            'format': _CACHE_FORMAT,
+            'machines': self.machines,
+            'shifts': self.shifts,
+            'reasons': self.reason_names.tolist(),
+            'cycle_times': self.cycle_times,
+            'planned_minutes': self.planned_production_minutes,
+            'downtime_means': self.downtime_means,
+            'defect_ranges': self.defect_ranges
+        }
+        return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+    
+    def generate_chunks(self, num_records: int, chunk_size: int = 100_000) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Draw num_records candidate records chunk by chunk, yielding each chunk's column arrays
+        """
+        for start in range(0, num_records, chunk_size):
+            yield self._draw_arrays(min(chunk_size, num_records - start))
+    
+    def _draw_arrays(self, num_records: int) -> Dict[str, np.ndarray]:
+        """
+        Draw the generated columns as a struct of arrays, names kept as int8 codes
+        """
+        # Draw every record in one vectorized pass (6 months period)
+        rng = self._rng
+        day_offsets = rng.integers(0, 181, num_records)
+        dates = np.datetime64('2025-07-01') + day_offsets
+        
+        # Skip weekends (reduced production); weekday 6 is Sunday, 1970-01-01 was a Thursday
+        weekday = (dates.astype('int64') + 3) % 7
+        keep = ~((weekday >= 6) & (rng.random(num_records) < 0.7))
+        dates = dates[keep]
+        n = len(dates)
+        
+        shift_idx = rng.integers(0, len(self.shifts), n, dtype=np.int8)
+        machine_idx = rng.integers(0, len(self.machines), n, dtype=np.int8)
+        
+        # Per-shift / per-machine parameters from the lookup arrays
+        planned_time = self._planned_by_shift[shift_idx]
+        downtime_mean = self._downtime_mean_by_machine[machine_idx]
+        ideal_cycle = self._ideal_by_machine[machine_idx]
+        cycle_low, cycle_high = self._cycle_range_by_machine[:, machine_idx]
+        defect_low, defect_high = self._defect_range_by_machine[:, machine_idx]
+        
+        # Generate realistic downtime (FMCG patterns), capped at 50% of planned time
+        downtime_minutes = np.clip(rng.normal(downtime_mean, 15), 0, planned_time * 0.5)
+        
+        # Assign downtime reason: none, minor (<=30 min), <=60 min, >60 min, each a coin flip between two causes
+        reason_code = {name: code for code, name in enumerate(self.reason_names)}
+        reason_pairs = np.array([[reason_code['None'], reason_code['None']],
+                                 [reason_code['Minor Stoppage'], reason_code['Power Failure']],
+                                 [reason_code['Cleaning'], reason_code['Breakdown']],
+                                 [reason_code['Breakdown'], reason_code['Changeover']]], dtype=np.int8)
+        band = np.digitize(downtime_minutes, [0, 30, 60], right=True)
+        reason_idx = reason_pairs[band, rng.integers(0, 2, n)]
+        
+        # Cycle times
+        actual_cycle = rng.uniform(cycle_low, cycle_high)
+        
+        # Production calculations; unit counts stay well below 2**31
+        available_time = planned_time - downtime_minutes
+        total_units = (available_time * 60 / actual_cycle).astype(np.int32)
+        
+        # Quality losses (FMCG realistic defect rates)
+        defect_rate = rng.uniform(defect_low, defect_high)
+        defective_units = (total_units * defect_rate / 100).astype(np.int32)
+        
+        return {
+            'date': dates,
+            'shift_idx': shift_idx,
+            'machine_idx': machine_idx,
+            'planned': planned_time,
+            'downtime': downtime_minutes.round(1),
+            'reason_idx': reason_idx,
+            'ideal_cycle': ideal_cycle,
+            'actual_cycle': actual_cycle.round(2),
+            'total_units': total_units,
+            'defective_units': defective_units,
+            'good_units': total_units - defective_units
+        }
+    
+    @staticmethod
+    def record_dates(df: pd.DataFrame) -> np.ndarray:
+        """
+        Record dates of df as datetime64[D]
+        """
+        return df['Date'].to_numpy().astype('datetime64[D]')
+    
+    @staticmethod
+    def _columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        NumPy arrays of df's numeric columns (zero-copy views of the frame's blocks)
+        """
+        return {col: df[col].to_numpy() for col in _NUMERIC_COLUMNS if col in df.columns}
+    
+    @staticmethod
+    def _categorical(codes: np.ndarray, names: np.ndarray) -> pd.Categorical:
+        """
+        Categorical over lookup codes with sorted categories, so groupby output keeps alphabetical order
+        """
+        order = np.argsort(names, kind='stable')
+        rank = np.empty(len(names), dtype=np.int8)
+        rank[order] = np.arange(len(names))
+        return pd.Categorical.from_codes(rank[codes], categories=names[order])
+    
+    @staticmethod
+    def _present_codes(codes: np.ndarray, names: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Renumber lookup codes to the observed names in sorted order, matching pd.factorize(sort=True)
+        """
+        present = np.bincount(codes, minlength=len(names)) > 0
+        order = np.argsort(names, kind='stable')
+        order = order[present[order]]
+        remap = np.full(len(names), -1, dtype=np.intp)
+        remap[order] = np.arange(len(order))
+        return remap[codes], names[order]
+    
+    @staticmethod
+    def _group_codes(df: pd.DataFrame, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Group codes and sorted unique keys for one grouping column (categorical keys factorize by code)
+        """
+        codes, uniques = pd.factorize(df[key], sort=True)
+        return codes, np.asarray(uniques)
+    
     def calculate_oee_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate comprehensive OEE metrics
@@ -147,65 +325,104 @@ class OEEAnalyzer:
         print("Calculating OEE metrics...")
         
         # Availability = (Planned - Downtime) / Planned
-        df['Availability'] = ((df['Planned_Production_Time'] - df['Downtime_Minutes']) / 
-                              df['Planned_Production_Time']) * 100
-        
         # Performance = (Ideal Cycle Time × Total Units) / Operating Time
-        operating_time = df['Planned_Production_Time'] - df['Downtime_Minutes']
-        df['Performance'] = (df['Ideal_Cycle_Time'] * df['Total_Units_Produced'] / 
-                            (operating_time * 60)) * 100
-        
         # Quality = Good Units / Total Units
-        df['Quality'] = (df['Good_Units'] / df['Total_Units_Produced']) * 100
-        
         # Overall OEE = Availability × Performance × Quality / 10000
-        df['OEE'] = (df['Availability'] * df['Performance'] * df['Quality']) / 10000
-        
-        # Cap values at 100% for realism
-        metric_cols = ['Availability', 'Performance', 'Quality', 'OEE']
-        df[metric_cols] = df[metric_cols].clip(upper=100)
+        # All four are computed in one pass and capped at 100% for realism
+        columns = self._columns(df)
+        availability, performance, quality, oee = _oee_components(
+            *(columns[col] for col in ['Planned_Production_Time', 'Downtime_Minutes', 'Ideal_Cycle_Time',
+                                       'Total_Units_Produced', 'Good_Units']))
+        # One block insertion for all four metrics instead of four fragmenting column adds
+        df[['Availability', 'Performance', 'Quality', 'OEE']] = np.column_stack(
+            [availability, performance, quality, oee])
         
+        # Own snapshot, so later edits to the returned frame don't change the stored results
         self.oee_results = df.copy()
         
         print("OEE Calculation Summary:")
-        print(f"Average OEE: {df['OEE'].mean():.2f}%")
-        print(f"Average Availability: {df['Availability'].mean():.2f}%")
-        print(f"Average Performance: {df['Performance'].mean():.2f}%")
-        print(f"Average Quality: {df['Quality'].mean():.2f}%")
+        print(f"Average OEE: {oee.mean():.2f}%")
+        print(f"Average Availability: {availability.mean():.2f}%")
+        print(f"Average Performance: {performance.mean():.2f}%")
+        print(f"Average Quality: {quality.mean():.2f}%")
         
         return df
     
+    @staticmethod
+    def _grouped_stats(columns: Dict[str, np.ndarray], codes: np.ndarray, uniques: np.ndarray,
+                       key: str, aggs: Dict[str, Tuple[str, str]]) -> pd.DataFrame:
+        """
+        Single-key groupby (mean/std/min/max/sum) as one NumPy sweep over integer group codes
+        """
+        valid = codes >= 0
+        codes = codes[valid]
+        n_groups = len(uniques)
+        counts = np.bincount(codes, minlength=n_groups)
+        # Group boundaries in key order for the min/max segment reductions
+        order = np.argsort(codes, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        
+        result = {}
+        for name, (col, func) in aggs.items():
+            if func not in ('mean', 'std', 'min', 'max', 'sum'):
+                raise ValueError(f"Unsupported aggregation: {func}")
+            values = np.ascontiguousarray(columns[col][valid])
+            if func in ('min', 'max'):
+                reducer = np.minimum if func == 'min' else np.maximum
+                result[name] = reducer.reduceat(values[order], starts)
+                continue
+            
+            sums = np.bincount(codes, weights=values, minlength=n_groups)
+            if func == 'sum':
+                result[name] = sums.astype(np.int64) if values.dtype.kind in 'iu' else sums
+                continue
+            
+            # Second pass over the residuals keeps the means as accurate as
+            # pandas' compensated summation, so rounded reports agree
+            means = sums / counts
+            deviation = values - means[codes]
+            means += np.bincount(codes, weights=deviation, minlength=n_groups) / counts
+            if func == 'mean':
+                result[name] = means
+            else:
+                deviation = values - means[codes]
+                squares = np.bincount(codes, weights=deviation * deviation, minlength=n_groups)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    result[name] = np.sqrt(squares / (counts - 1))
+        
+        return pd.DataFrame(result, index=pd.Index(uniques, name=key))
+    
     def machine_wise_analysis(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Machine-wise OEE analysis
         """
-        machine_stats = df.groupby('Machine_Name').agg({
-            'OEE': ['mean', 'std', 'min', 'max'],
-            'Availability': 'mean',
-            'Performance': 'mean',
-            'Quality': 'mean',
-            'Total_Units_Produced': 'sum',
-            'Defective_Units': 'sum',
-            'Downtime_Minutes': 'mean'
+        machine_stats = self._grouped_stats(self._columns(df), *self._group_codes(df, 'Machine_Name'),
+                                            'Machine_Name', {
+            'OEE_Mean': ('OEE', 'mean'),
+            'OEE_Std': ('OEE', 'std'),
+            'OEE_Min': ('OEE', 'min'),
+            'OEE_Max': ('OEE', 'max'),
+            'Availability_Mean': ('Availability', 'mean'),
+            'Performance_Mean': ('Performance', 'mean'),
+            'Quality_Mean': ('Quality', 'mean'),
+            'Total_Units': ('Total_Units_Produced', 'sum'),
+            'Defective_Units': ('Defective_Units', 'sum'),
+            'Avg_Downtime': ('Downtime_Minutes', 'mean')
         }).round(2)
         
-        machine_stats.columns = ['OEE_Mean', 'OEE_Std', 'OEE_Min', 'OEE_Max',
-                                'Availability_Mean', 'Performance_Mean', 'Quality_Mean',
-                                'Total_Units', 'Defective_Units', 'Avg_Downtime']
-        
         return machine_stats
     
     def shift_wise_analysis(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Shift-wise OEE analysis
         """
-        shift_stats = df.groupby('Shift').agg({
-            'OEE': 'mean',
-            'Availability': 'mean',
-            'Performance': 'mean',
-            'Quality': 'mean',
-            'Total_Units_Produced': 'sum',
-            'Downtime_Minutes': 'mean'
+        shift_stats = self._grouped_stats(self._columns(df), *self._group_codes(df, 'Shift'), 'Shift', {
+            'OEE': ('OEE', 'mean'),
+            'Availability': ('Availability', 'mean'),
+            'Performance': ('Performance', 'mean'),
+            'Quality': ('Quality', 'mean'),
+            'Total_Units_Produced': ('Total_Units_Produced', 'sum'),
+            'Downtime_Minutes': ('Downtime_Minutes', 'mean')
         }).round(2)
         
         return shift_stats
@@ -214,15 +431,20 @@ class OEEAnalyzer:
         """
         Monthly OEE trend analysis
         """
-        df['YearMonth'] = pd.to_datetime(df['Date']).dt.to_period('M')
+        # Months since 1970 offset from the first month bin directly, no sort
+        months = self.record_dates(df).astype('datetime64[M]').astype(np.int64)
+        first = months.min()
+        month_range = np.arange(first, months.max() + 1).astype('datetime64[M]')
+        codes, month_values = self._present_codes(months - first, month_range)
+        uniques = pd.PeriodIndex(pd.DatetimeIndex(month_values), freq='M')
         
-        monthly_stats = df.groupby('YearMonth').agg({
-            'OEE': 'mean',
-            'Availability': 'mean',
-            'Performance': 'mean',
-            'Quality': 'mean',
-            'Total_Units_Produced': 'sum',
-            'Downtime_Minutes': 'mean'
+        monthly_stats = self._grouped_stats(self._columns(df), codes, uniques, 'YearMonth', {
+            'OEE': ('OEE', 'mean'),
+            'Availability': ('Availability', 'mean'),
+            'Performance': ('Performance', 'mean'),
+            'Quality': ('Quality', 'mean'),
+            'Total_Units_Produced': ('Total_Units_Produced', 'sum'),
+            'Downtime_Minutes': ('Downtime_Minutes', 'mean')
         }).round(2)
         
         return monthly_stats
@@ -240,15 +462,19 @@ def main():
     analyzer = OEEAnalyzer()
     
     # Generate production data
-    production_data = analyzer.generate_production_data(4000)
+    production_data = analyzer.generate_production_data(4000, use_cache=True)
     
     # Calculate OEE metrics
     oee_data = analyzer.calculate_oee_metrics(production_data)
     
-    # Perform analyses
-    machine_analysis = analyzer.machine_wise_analysis(oee_data)
-    shift_analysis = analyzer.shift_wise_analysis(oee_data)
-    monthly_analysis = analyzer.monthly_trend_analysis(oee_data)
+    # Perform analyses; they only read oee_data, so the three run concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        machine_future = pool.submit(analyzer.machine_wise_analysis, oee_data)
+        shift_future = pool.submit(analyzer.shift_wise_analysis, oee_data)
+        monthly_future = pool.submit(analyzer.monthly_trend_analysis, oee_data)
+        machine_analysis = machine_future.result()
+        shift_analysis = shift_future.result()
+        monthly_analysis = monthly_future.result()
     
     print("\n" + "=" * 60)
     print("ANALYSIS COMPLETE")
@@ -5,11 +5,140 @@ Export Production Data to Excel Format
 FMCG Manufacturing Plant - OEE Analysis Project
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import numpy as np
 from oee_analysis import OEEAnalyzer
 from detailed_analysis import DetailedOEEAnalysis
 import warnings
-warnings.filterwarnings('ignore')
+
+try:
+    import xlsxwriter  # Optional: serializes sheets faster than openpyxl
+except ImportError:
+    xlsxwriter = None
+
+try:
+    from numba import njit  # Optional: one-pass summary reductions
+except ImportError:
+    njit = None
+
+# Datetime cell format pandas uses by default, shared by the fast sheet writer
+_DATETIME_FORMAT = 'YYYY-MM-DD HH:MM:SS'
+# Day zero of Excel's 1900 date system, valid for every date after February 1900
+_EXCEL_EPOCH = np.datetime64('1899-12-30')
+
+def _write_large_sheet(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str) -> None:
+    """
+    Write a large frame with pandas' styled header, then feed its body straight to the
+    engine's worksheet, skipping pandas' per-cell formatter
+    """
+    # The fast paths below assume finite floats; one vectorized check up front sends any frame
+    # holding NaN or inf through pandas' formatter instead (blank cells, 'inf' text)
+    floats = df.select_dtypes(include='floating')
+    if not np.isfinite(floats.to_numpy()).all():
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+    
+    df.head(0).to_excel(writer, sheet_name=sheet_name, index=False)
+    worksheet = writer.sheets[sheet_name]
+    if writer.engine != 'xlsxwriter':
+        for row in df.itertuples(index=False, name=None):
+            worksheet.append(row)
+        # append() leaves openpyxl's own date format; use the one pandas applies
+        for col_num, col in enumerate(df.columns, start=1):
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                for (cell,) in worksheet.iter_rows(min_row=2, min_col=col_num, max_col=col_num):
+                    cell.number_format = _DATETIME_FORMAT
+        return
+    
+    # Column by column from the arrays: dates become Excel serial numbers in one vectorized
+    # step, categorical labels are decoded once per column instead of once per cell. Each
+    # column's typed writer is resolved here, so the cell loop skips write()'s type checks
+    date_format = writer.book.add_format({'num_format': _DATETIME_FORMAT})
+    for col_num, col in enumerate(df.columns):
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            write, cell_format = worksheet.write_number, date_format
+            values = ((series.to_numpy() - _EXCEL_EPOCH) / np.timedelta64(1, 'D')).tolist()
+        elif pd.api.types.is_numeric_dtype(series):
+            write, cell_format, values = worksheet.write_number, None, series.tolist()
+        else:
+            write, cell_format, values = worksheet.write_string, None, series.tolist()
+        for row_num, value in enumerate(values, start=1):
+            write(row_num, col_num, value, cell_format)
+
+# Columns reduced by the summary kernel, in column order of its input array
+_SUMMARY_COLUMNS = ['OEE', 'Availability', 'Performance', 'Quality', 'Total_Units_Produced',
+                    'Downtime_Minutes', 'Defective_Units', 'Actual_Cycle_Time']
+
+def _column_summary_numpy(values, shift_codes, n_shifts):
+    """
+    Per-column sum, min, max, argmin and argmax of a (records, columns) array, plus
+    per-shift sums and counts of the first column, NumPy version
+    """
+    return (values.sum(axis=0), values.min(axis=0), values.max(axis=0),
+            values.argmin(axis=0), values.argmax(axis=0),
+            np.bincount(shift_codes, weights=values[:, 0], minlength=n_shifts),
+            np.bincount(shift_codes, minlength=n_shifts))
+
+if njit is None:
+    _column_summary = _column_summary_numpy
+else:
+    # Serial on purpose: argmin/argmax must report the first extreme, like pandas idxmin/idxmax
+    @njit(cache=True)
+    def _column_summary(values, shift_codes, n_shifts):
+        n_records, n_cols = values.shape
+        sums = np.zeros(n_cols)
+        mins = values[0].copy()
+        maxs = values[0].copy()
+        argmins = np.zeros(n_cols, dtype=np.int64)
+        argmaxs = np.zeros(n_cols, dtype=np.int64)
+        shift_sums = np.zeros(n_shifts)
+        shift_counts = np.zeros(n_shifts, dtype=np.int64)
+        for i in range(n_records):
+            for c in range(n_cols):
+                v = values[i, c]
+                sums[c] += v
+                if v < mins[c]:
+                    mins[c] = v
+                    argmins[c] = i
+                if v > maxs[c]:
+                    maxs[c] = v
+                    argmaxs[c] = i
+            shift_sums[shift_codes[i]] += values[i, 0]
+            shift_counts[shift_codes[i]] += 1
+        return sums, mins, maxs, argmins, argmaxs, shift_sums, shift_counts
+
+def _categorize_labels(df):
+    """
+    Make Shift and Machine_Name categorical so sorting and grouping compare integer codes
+    """
+    # The analyzer already builds them as categoricals; this only converts plain string frames
+    for col in ('Shift', 'Machine_Name'):
+        if not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+def _write_metric_sheet(writer: pd.ExcelWriter, sheet_name: str, metrics, values) -> None:
+    """
+    Write a Metric/Value sheet under pandas' styled header, one row per metric with the
+    value keeping its own Python type
+    """
+    pd.DataFrame(columns=['Metric', 'Value']).to_excel(writer, sheet_name=sheet_name, index=False)
+    worksheet = writer.sheets[sheet_name]
+    for row_num, row in enumerate(zip(metrics, values), start=1):
+        if writer.engine == 'xlsxwriter':
+            worksheet.write_row(row_num, 0, row)
+        else:
+            worksheet.append(row)
+
+def _sorted_export_frame(analyzer: OEEAnalyzer, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    df with datetime64 dates, sorted by date, shift and machine; df itself is left untouched
+    """
+    # The analyzer hands back its datetime64 array for its own frames, so nothing is re-parsed.
+    # assign + sort_values build the one new frame needed, no up-front copy of every column
+    return df.assign(Date=analyzer.record_dates(df)).sort_values(['Date', 'Shift', 'Machine_Name'])
 
 def export_production_data_to_excel():
     """
@@ -19,26 +148,45 @@ def export_production_data_to_excel():
     
     # Initialize and run analysis
     analyzer = OEEAnalyzer()
-    production_data = analyzer.generate_production_data(4000)
-    oee_data = analyzer.calculate_oee_metrics(production_data)
+    production_data = analyzer.generate_production_data(4000, use_cache=True)
+    oee_data = _categorize_labels(analyzer.calculate_oee_metrics(production_data))
     
     detailed_analyzer = DetailedOEEAnalysis(analyzer)
     
-    # Create Excel writer with multiple sheets
-    with pd.ExcelWriter('c:/Users/rohil/Downloads/project 1/OEE_Analysis_Data.xlsx', engine='openpyxl') as writer:
+    # The three aggregate sheets only read oee_data, so they are computed in the background
+    # while the large sheets are written; the workbook itself is only touched from this thread
+    pool = ThreadPoolExecutor(max_workers=3)
+    machine_future = pool.submit(analyzer.machine_wise_analysis, oee_data)
+    shift_future = pool.submit(analyzer.shift_wise_analysis, oee_data)
+    monthly_future = pool.submit(analyzer.monthly_trend_analysis, oee_data)
+    pool.shutdown(wait=False)
+    
+    # Create Excel writer with multiple sheets. xlsxwriter's constant_memory mode is not used:
+    # pandas emits cells column by column, and that mode drops every cell left behind the current row
+    # xlsxwriter stores every label once in its shared-string table and has each cell point at it;
+    # with no URLs in the data, its per-string URL match in write() is switched off as well
+    if xlsxwriter is None:
+        engine, engine_kwargs = 'openpyxl', None
+    else:
+        engine, engine_kwargs = 'xlsxwriter', {'options': {'strings_to_urls': False}}
+    # Engine warnings are silenced for the workbook writes only, not for the whole process
+    with warnings.catch_warnings(), \
+            pd.ExcelWriter('c:/Users/rohil/Downloads/project 1/OEE_Analysis_Data.xlsx', engine=engine,
+                           datetime_format=_DATETIME_FORMAT, engine_kwargs=engine_kwargs) as writer:
+        warnings.simplefilter('ignore')
         
         # Sheet 1: Raw Production Data
         print("Exporting Raw Production Data...")
-        raw_data_export = production_data.copy()
-        raw_data_export['Date'] = pd.to_datetime(raw_data_export['Date'])
-        raw_data_export = raw_data_export.sort_values(['Date', 'Shift', 'Machine_Name'])
-        raw_data_export.to_excel(writer, sheet_name='Raw_Production_Data', index=False)
+        raw_data_export = _sorted_export_frame(analyzer, production_data)
+        _write_large_sheet(writer, raw_data_export, 'Raw_Production_Data')
         
         # Sheet 2: OEE Calculated Data
         print("Exporting OEE Calculated Data...")
-        oee_export = oee_data.copy()
-        oee_export['Date'] = pd.to_datetime(oee_export['Date'])
-        oee_export = oee_export.sort_values(['Date', 'Shift', 'Machine_Name'])
+        # calculate_oee_metrics returns the generated frame itself, so its sorted export is reused
+        if oee_data is production_data:
+            oee_export = raw_data_export
+        else:
+            oee_export = _sorted_export_frame(analyzer, oee_data)
         
         # Reorder columns for better readability
         oee_columns = ['Date', 'Shift', 'Machine_Name', 'Planned_Production_Time', 
@@ -46,80 +194,99 @@ def export_production_data_to_excel():
                       'Actual_Cycle_Time', 'Total_Units_Produced', 'Defective_Units', 
                       'Good_Units', 'Availability', 'Performance', 'Quality', 'OEE']
         oee_export = oee_export[oee_columns]
-        oee_export.to_excel(writer, sheet_name='OEE_Calculated_Data', index=False)
+        _write_large_sheet(writer, oee_export, 'OEE_Calculated_Data')
         
         # Sheet 3: Machine-wise Analysis
         print("Exporting Machine-wise Analysis...")
-        machine_analysis = analyzer.machine_wise_analysis(oee_data)
+        machine_analysis = machine_future.result()
         machine_analysis.to_excel(writer, sheet_name='Machine_Analysis')
         
         # Sheet 4: Shift-wise Analysis
         print("Exporting Shift-wise Analysis...")
-        shift_analysis = analyzer.shift_wise_analysis(oee_data)
+        shift_analysis = shift_future.result()
         shift_analysis.to_excel(writer, sheet_name='Shift_Analysis')
         
         # Sheet 5: Monthly Trend Analysis
         print("Exporting Monthly Trend Analysis...")
-        monthly_analysis = analyzer.monthly_trend_analysis(oee_data)
+        monthly_analysis = monthly_future.result()
         monthly_analysis.to_excel(writer, sheet_name='Monthly_Trends')
         
         # Sheet 6: Downtime Analysis
         print("Exporting Downtime Analysis...")
         downtime_summary, machine_downtime = detailed_analyzer.downtime_pareto_analysis()
-        downtime_summary.to_excel(writer, sheet_name='Downtime_Summary')
+        downtime_summary.to_excel(writer, sheet_name='Downtime_Summary', float_format='%.2f')
         
         # Sheet 7: Speed Loss Analysis
         print("Exporting Speed Loss Analysis...")
         speed_loss_summary, worst_speed = detailed_analyzer.speed_loss_analysis()
-        speed_loss_summary.to_excel(writer, sheet_name='Speed_Loss_Analysis')
+        speed_loss_summary.to_excel(writer, sheet_name='Speed_Loss_Analysis', float_format='%.2f')
         worst_speed.to_excel(writer, sheet_name='Worst_Speed_Records', index=False)
         
         # Sheet 8: Quality Loss Analysis
         print("Exporting Quality Loss Analysis...")
         quality_summary, shift_quality = detailed_analyzer.quality_loss_analysis()
-        quality_summary.to_excel(writer, sheet_name='Quality_Analysis')
-        shift_quality.to_excel(writer, sheet_name='Shift_Quality')
+        quality_summary.to_excel(writer, sheet_name='Quality_Analysis', float_format='%.3f')
+        shift_quality.to_excel(writer, sheet_name='Shift_Quality', float_format='%.2f')
         
         # Sheet 9: Data Summary Statistics
         print("Exporting Summary Statistics...")
-        summary_stats = pd.DataFrame({
-            'Metric': [
-                'Total Records',
-                'Date Range Start',
-                'Date Range End',
-                'Total Machines',
-                'Total Shifts',
-                'Total Units Produced',
-                'Total Defective Units',
-                'Average OEE (%)',
-                'Average Availability (%)',
-                'Average Performance (%)',
-                'Average Quality (%)',
-                'Total Downtime (Minutes)',
-                'Average Cycle Time (Seconds)',
-                'Production Days'
-            ],
-            'Value': [
-                len(oee_data),
-                oee_data['Date'].min(),
-                oee_data['Date'].max(),
-                len(oee_data['Machine_Name'].unique()),
-                len(oee_data['Shift'].unique()),
-                oee_data['Total_Units_Produced'].sum(),
-                oee_data['Defective_Units'].sum(),
-                round(oee_data['OEE'].mean(), 2),
-                round(oee_data['Availability'].mean(), 2),
-                round(oee_data['Performance'].mean(), 2),
-                round(oee_data['Quality'].mean(), 2),
-                oee_data['Downtime_Minutes'].sum(),
-                round(oee_data['Actual_Cycle_Time'].mean(), 2),
-                len(oee_data['Date'].unique())
-            ]
-        })
-        summary_stats.to_excel(writer, sheet_name='Summary_Statistics', index=False)
+        # Every numeric reduction behind sheets 9 and 10 comes from one pass over the records
+        shift_names = oee_data['Shift'].cat.categories
+        shift_codes = oee_data['Shift'].cat.codes.to_numpy(dtype=np.int64)
+        values = np.column_stack([oee_data[col].to_numpy(dtype=np.float64) for col in _SUMMARY_COLUMNS])
+        sums, mins, maxs, argmins, argmaxs, shift_sums, shift_counts = _column_summary(
+            values, shift_codes, len(shift_names))
+        stat = {col: i for i, col in enumerate(_SUMMARY_COLUMNS)}
+        means = sums / len(oee_data)
+        # Mixed-type values go straight to the worksheet instead of through an object-dtype frame
+        summary_metrics = [
+            'Total Records',
+            'Date Range Start',
+            'Date Range End',
+            'Total Machines',
+            'Total Shifts',
+            'Total Units Produced',
+            'Total Defective Units',
+            'Average OEE (%)',
+            'Average Availability (%)',
+            'Average Performance (%)',
+            'Average Quality (%)',
+            'Total Downtime (Minutes)',
+            'Average Cycle Time (Seconds)',
+            'Production Days'
+        ]
+        summary_values = [
+            len(oee_data),
+            oee_data['Date'].min(),
+            oee_data['Date'].max(),
+            oee_data['Machine_Name'].nunique(),
+            oee_data['Shift'].nunique(),
+            int(sums[stat['Total_Units_Produced']]),
+            int(sums[stat['Defective_Units']]),
+            round(means[stat['OEE']], 2),
+            round(means[stat['Availability']], 2),
+            round(means[stat['Performance']], 2),
+            round(means[stat['Quality']], 2),
+            sums[stat['Downtime_Minutes']],
+            round(means[stat['Actual_Cycle_Time']], 2),
+            oee_data['Date'].nunique()
+        ]
+        _write_metric_sheet(writer, 'Summary_Statistics', summary_metrics, summary_values)
         
         # Sheet 10: Top Performers
         print("Exporting Top Performers...")
+        # Extreme values come straight from the kernel's arrays; only the machine and date of
+        # each extreme row are read back from the frame, in a single iloc
+        extremes = [('OEE', maxs, argmaxs), ('OEE', mins, argmins), ('Availability', maxs, argmaxs),
+                    ('Performance', maxs, argmaxs), ('Quality', maxs, argmaxs),
+                    ('Total_Units_Produced', maxs, argmaxs), ('Downtime_Minutes', mins, argmins)]
+        best = [bounds[stat[col]] for col, bounds, _ in extremes]
+        top_rows = oee_data[['Machine_Name', 'Date']].iloc[
+            [positions[stat[col]] for col, _, positions in extremes]]
+        # Only shifts present in the data compete, as with an observed groupby
+        observed = np.flatnonzero(shift_counts)
+        shift_oee = shift_sums[observed] / shift_counts[observed]
+        best_shift = shift_oee.argmax()
         top_performers = pd.DataFrame({
             'Category': [
                 'Best OEE Performance',
@@ -131,36 +298,20 @@ def export_production_data_to_excel():
                 'Lowest Downtime',
                 'Best Shift Performance'
             ],
-            'Machine/Shift': [
-                oee_data.loc[oee_data['OEE'].idxmax(), 'Machine_Name'],
-                oee_data.loc[oee_data['OEE'].idxmin(), 'Machine_Name'],
-                oee_data.loc[oee_data['Availability'].idxmax(), 'Machine_Name'],
-                oee_data.loc[oee_data['Performance'].idxmax(), 'Machine_Name'],
-                oee_data.loc[oee_data['Quality'].idxmax(), 'Machine_Name'],
-                oee_data.loc[oee_data['Total_Units_Produced'].idxmax(), 'Machine_Name'],
-                oee_data.loc[oee_data['Downtime_Minutes'].idxmin(), 'Machine_Name'],
-                oee_data.groupby('Shift')['OEE'].mean().idxmax()
+            'Machine/Shift': top_rows['Machine_Name'].tolist() + [
+                shift_names[observed[best_shift]]
             ],
             'Value': [
-                f"{oee_data['OEE'].max():.2f}%",
-                f"{oee_data['OEE'].min():.2f}%",
-                f"{oee_data['Availability'].max():.2f}%",
-                f"{oee_data['Performance'].max():.2f}%",
-                f"{oee_data['Quality'].max():.2f}%",
-                f"{oee_data['Total_Units_Produced'].max():,.0f}",
-                f"{oee_data['Downtime_Minutes'].min():.1f} min",
-                f"{oee_data.groupby('Shift')['OEE'].mean().max():.2f}%"
+                f"{best[0]:.2f}%",
+                f"{best[1]:.2f}%",
+                f"{best[2]:.2f}%",
+                f"{best[3]:.2f}%",
+                f"{best[4]:.2f}%",
+                f"{best[5]:,.0f}",
+                f"{best[6]:.1f} min",
+                f"{shift_oee[best_shift]:.2f}%"
             ],
-            'Date': [
-                oee_data.loc[oee_data['OEE'].idxmax(), 'Date'],
-                oee_data.loc[oee_data['OEE'].idxmin(), 'Date'],
-                oee_data.loc[oee_data['Availability'].idxmax(), 'Date'],
-                oee_data.loc[oee_data['Performance'].idxmax(), 'Date'],
-                oee_data.loc[oee_data['Quality'].idxmax(), 'Date'],
-                oee_data.loc[oee_data['Total_Units_Produced'].idxmax(), 'Date'],
-                oee_data.loc[oee_data['Downtime_Minutes'].idxmin(), 'Date'],
-                'Overall'
-            ]
+            'Date': top_rows['Date'].tolist() + ['Overall']
         })
         top_performers.to_excel(writer, sheet_name='Top_Performers', index=False)
     